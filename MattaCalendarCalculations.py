@@ -13,8 +13,39 @@ Contains functions for finding the date of Easter according to the
 
 
 import datetime
-from math import floor
-from math import fmod
+import operator
+import os
+import warnings
+from functools import lru_cache
+from typing import NamedTuple
+
+# NumPy is optional; it is only needed for the array (_vec) functions.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Ahead-of-time compiled calculation kernels (built from _calendar_kernels.pyx
+#    with setup.py) are used in place of the Python ones below, when present.
+try:
+    import _calendar_kernels
+except ImportError:
+    _calendar_kernels = None
+
+# Numba is optional and opt-in, as importing it and compiling the kernels adds
+#    about half a second to start-up: set the environment variable
+#    MATTA_CALENDAR_NUMBA=1 before importing this module to use it. It is not
+#    used when the compiled kernels are present; otherwise the calculation
+#    kernels run as plain Python.
+njit = None
+if _calendar_kernels is None and os.environ.get('MATTA_CALENDAR_NUMBA') == '1':
+    try:
+        from numba import njit
+    except ImportError:
+        pass
+if njit is None:
+    def njit(*args, **kwargs):
+        return lambda f: f
 
 # Constants
 # Although the Julian calendar was introducd in 45 BC, its leap years
@@ -25,6 +56,118 @@ MINIMUM_YEAR_GREGORIAN = 1582   # year defined and instituted
 MINIMUM_YEAR_MILANKOVIC = 1923  # year defined and instituted
 MINIMUM_YEAR_JULIAN = 325   # Constantine proclaims date of Easter
 
+# Largest magnitude accepted for the year, month, and day of a date, and for a
+#    CJDN. These keep every intermediate value within the 64-bit integers of the
+#    compiled (Numba or Cython) kernels, so that results do not depend on which
+#    kernels are in use.
+MAXIMUM_DATE_PART = 10**12
+MAXIMUM_CJDN = 10**15
+
+# The days in a week for each of the Gregorian, Revised Julian, and Julian calendars.
+DAYS_IN_WEEK = 7
+
+def _requireNumPy():
+    ''' Raises an ImportError if NumPy, needed by the array (_vec) functions,
+           is not installed.
+    '''
+    if np is None:
+        raise ImportError('NumPy is required for the array (_vec) calendar functions')
+
+def _pISO8601Date(iYear, iMonth, iDay):
+    ''' Formats a date as an ISO 8601 YYYY-MM-DD string.
+        Years before 0 keep a leading minus sign (e.g. -0044-03-15).
+    '''
+    sSign = '-' if iYear < 0 else ''
+    return f'{sSign}{abs(iYear):04d}-{iMonth:02d}-{iDay:02d}'
+
+class GregDate(NamedTuple):
+    ''' A date on the Gregorian calendar.
+        str() returns the date in ISO 8601 YYYY-MM-DD format.
+    '''
+    year: int
+    month: int
+    day: int
+
+    def __str__(self):
+        return _pISO8601Date(self.year, self.month, self.day)
+
+class MilDate(NamedTuple):
+    ''' A date on the Revised Julian (Milanković) calendar.
+        str() returns the date in ISO 8601 YYYY-MM-DD format.
+    '''
+    year: int
+    month: int
+    day: int
+
+    def __str__(self):
+        return _pISO8601Date(self.year, self.month, self.day)
+
+class JulDate(NamedTuple):
+    ''' A date on the Julian calendar.
+        str() returns the date in ISO 8601 YYYY-MM-DD format.
+    '''
+    year: int
+    month: int
+    day: int
+
+    def __str__(self):
+        return _pISO8601Date(self.year, self.month, self.day)
+
+class GregDateFull(NamedTuple):
+    ''' A date on the Gregorian calendar, with its day of the week
+           (as returned by DoW: Monday = 1; Sunday = 7).
+        str() returns the date in ISO 8601 YYYY-MM-DD format.
+    '''
+    year: int
+    month: int
+    day: int
+    dow: int
+
+    def __str__(self):
+        return _pISO8601Date(self.year, self.month, self.day)
+
+class MilDateFull(NamedTuple):
+    ''' A date on the Revised Julian (Milanković) calendar, with its day of the week
+           (as returned by DoW: Monday = 1; Sunday = 7).
+        str() returns the date in ISO 8601 YYYY-MM-DD format.
+    '''
+    year: int
+    month: int
+    day: int
+    dow: int
+
+    def __str__(self):
+        return _pISO8601Date(self.year, self.month, self.day)
+
+class JulDateFull(NamedTuple):
+    ''' A date on the Julian calendar, with its day of the week
+           (as returned by DoW: Monday = 1; Sunday = 7).
+        str() returns the date in ISO 8601 YYYY-MM-DD format.
+    '''
+    year: int
+    month: int
+    day: int
+    dow: int
+
+    def __str__(self):
+        return _pISO8601Date(self.year, self.month, self.day)
+
+if _calendar_kernels is not None:
+    _greg_to_cjdn = _calendar_kernels.greg_to_cjdn
+else:
+    @njit('int64(int64, int64, int64)', cache=True)
+    def _greg_to_cjdn(iYear, iMonth, iDay):
+        ''' Calculation kernel for pGregorianToCJDN.
+        '''
+        iC0 = (iMonth - 3) // 12
+        iX4 = iYear + iC0
+        iX3 = iX4 // 100
+        iX2 = iX4 % 100
+        iX1 = iMonth - (12 * iC0) - 3
+        iJ = ((146097 * iX3) // 4) + ((36525 * iX2) // 100) + (((153 * iX1) + 2) // 5) + iDay + 1721119
+
+        return iJ
+
 def pGregorianToCJDN(sYear, sMonth, sDay):
     ''' Converts a Gregorian date passed in a three strings (year, month, day) to a
            Chronological Julian Day Number.
@@ -34,57 +177,198 @@ def pGregorianToCJDN(sYear, sMonth, sDay):
         The zero point for the CJDN is 1 January -4712 (the whole day in local time).
         From: http://aa.quae.nl/en/reken/juliaansedag.html .
     '''
-    iYear = int(sYear)
-    iMonth = int(sMonth)
-    iDay = int(sDay)
+    # integers (including NumPy integers) pass straight through; strings are parsed
+    try:
+        iYear, iMonth, iDay = operator.index(sYear), operator.index(sMonth), operator.index(sDay)
+    except TypeError:
+        iYear, iMonth, iDay = int(sYear), int(sMonth), int(sDay)
 
     # check date is above minimum for the calendar
     if iYear < MINIMUM_YEAR_GREGORIAN:
         return False
 
-    # calculation
-    iC0 = floor((iMonth - 3) / 12)
-    iX4 = iYear + iC0
-    iX3 = floor(iX4 / 100)
-    iX2 = int(fmod(iX4, 100))
-    iX1 = iMonth - (12 * iC0) - 3
-    iJ = floor((146097 * iX3) / 4) + floor((36525 * iX2) / 100) + floor(((153 * iX1) + 2) / 5) + iDay + 1721119
+    # check date is within the range supported by the calculation kernels
+    if max(abs(iYear), abs(iMonth), abs(iDay)) > MAXIMUM_DATE_PART:
+        return False
+
+    return _greg_to_cjdn(iYear, iMonth, iDay)
+
+def pGregorianToCJDN_vec(years, months, days):
+    ''' Array version of pGregorianToCJDN. Converts Gregorian dates passed as
+           array-likes of years, months, and days to a NumPy int64 array of
+           Chronological Julian Day Numbers (0-d for scalar input).
+        No minimum year or range check is made; callers should filter their dates
+           first. Years, months, or days beyond MAXIMUM_DATE_PART can silently
+           overflow int64.
+        Requires NumPy.
+    '''
+    _requireNumPy()
+    aYear = np.asarray(years, dtype=np.int64)
+    aMonth = np.asarray(months, dtype=np.int64)
+    aDay = np.asarray(days, dtype=np.int64)
+
+    # calculation (floor division matches floor() for negative values)
+    aC0 = (aMonth - 3) // 12
+    aX4 = aYear + aC0
+    aX3 = aX4 // 100
+    aX2 = aX4 % 100
+    aX1 = aMonth - (12 * aC0) - 3
+    aJ = ((146097 * aX3) // 4) + ((36525 * aX2) // 100) + (((153 * aX1) + 2) // 5) + aDay + 1721119
+
+    return np.asarray(aJ)
+
+# The calculation kernel as a NumPy ufunc, for pGregorianToCJDN_batch
+_fGregorianToCJDNBatch = np.frompyfunc(_greg_to_cjdn, 3, 1) if np is not None else None
+
+def pGregorianToCJDN_batch(years, months, days):
+    ''' Batch version of pGregorianToCJDN for array-likes such as pandas Series,
+           e.g. df['cjdn'] = pGregorianToCJDN_batch(df.year, df.month, df.day)
+        The inputs are converted to int64, as for pGregorianToCJDN_vec, then the
+           scalar calculation kernel (compiled, if the compiled kernels are
+           built or Numba is enabled) is applied to each date. Returns a NumPy
+           int64 array (0-d for scalar input).
+        No minimum year or range check is made (see MAXIMUM_DATE_PART).
+        Requires NumPy.
+    '''
+    _requireNumPy()
+    aYear = np.asarray(years, dtype=np.int64)
+    aMonth = np.asarray(months, dtype=np.int64)
+    aDay = np.asarray(days, dtype=np.int64)
+
+    return np.asarray(_fGregorianToCJDNBatch(aYear, aMonth, aDay), dtype=np.int64)
+
+if _calendar_kernels is not None:
+    _cjdn_to_greg = _calendar_kernels.cjdn_to_greg
+else:
+    @njit('UniTuple(int64, 3)(int64)', cache=True)
+    def _cjdn_to_greg(iCJDN):
+        ''' Calculation kernel for pCJDNToGregorian. Returns (year, month, day).
+        '''
+        #Perform the calculation
+        iK3 = (4 * (iCJDN - 1721120)) + 3
+        iX3 = iK3 // 146097
+        iK2 = (100 * ((iK3 % 146097) // 4)) + 99
+        iX2 = iK2 // 36525
+        iK1 = (5 * ((iK2 % 36525) // 100)) + 2
+        iX1 = iK1 // 153
+        iC0 = (iX1 + 2) // 12
+        iYear = (100 * iX3) + iX2 + iC0
+        iMonth = (iX1 - (12 * iC0)) + 3
+        iDay = ((iK1 % 153) // 5) + 1
+
+        return iYear, iMonth, iDay
+
+@lru_cache(maxsize=4096)
+def _pCJDNToGregorian_ymd(iCJDN):
+    ''' Returns the Gregorian date for a given CJDN as a GregDate (year, month, day),
+           calculating all three parts in a single pass.
+    '''
+    return GregDate(*_cjdn_to_greg(iCJDN))
+
+def pCJDNToGregorianDate(iCJDN):
+    ''' Returns a Gregorian date as a GregDate (year, month, day) from a given
+        Chronological Julian Day Number (CJDN).
+        str() of the result gives the date in ISO 8601 YYYY-MM-DD format.
+    '''
+
+    try:
+        iCJDN = operator.index(iCJDN)
+    except TypeError:
+        return False
+
+    # check CJDN is within the range supported by the calculation kernels
+    if abs(iCJDN) > MAXIMUM_CJDN:
+        return False
 
-    return iJ
+    return _pCJDNToGregorian_ymd(iCJDN)
 
 def pCJDNToGregorian(iCJDN, bDoYear=False, bDoMonth=False, bDoDay=False):
     ''' Returns a Gregorian date is ISO 8601 YYYY-MM-DD format from a given
         Chronological Julian Day Number (CJDN).
-        If only part of the date is required (e.g. just the day), this is returned as an integer.
+        The bDoYear, bDoMonth, and bDoDay flags are deprecated; if one is set, only
+           that part of the date is returned, as an integer. Use the .year, .month,
+           and .day fields of pCJDNToGregorianDate's GregDate instead.
     '''
 
-    if not isinstance(iCJDN, int):
+    dDate = pCJDNToGregorianDate(iCJDN)
+    if dDate is False:
         return False
 
-    #Perform the calculation
-    iK3 = (4 * (iCJDN - 1721120)) + 3
-    iX3 = floor(iK3 / 146097)
-    iK2 = (100 * floor(int(fmod(iK3, 146097)) / 4)) + 99
-    iX2 = floor(iK2 / 36525)
-    iK1 = (5 * floor(int(fmod(iK2, 36525)) / 100)) + 2
-    iX1 = floor(iK1 / 153)
-    iC0 = floor((iX1 + 2) / 12)
-    iYear = (100 * iX3) + iX2 + iC0
-    iMonth = (iX1 - (12 * iC0)) + 3
-    iDay = floor(int(fmod(iK1, 153)) / 5) + 1
-
-    #Return integer part, if only one part of the date is required.
+    #Deprecated: return integer part, if only one part of the date is required.
     #Start at year, and rudely ignore any subsequent integers requested.
-    if bDoYear:
-        return iYear
-    if bDoMonth:
-        return iMonth
-    if bDoDay:
-        return iDay
+    if bDoYear or bDoMonth or bDoDay:
+        warnings.warn('pCJDNToGregorian: bDoYear, bDoMonth, and bDoDay are deprecated; use the '
+                      '.year, .month, and .day fields of pCJDNToGregorianDate instead',
+                      DeprecationWarning, stacklevel=2)
+        if bDoYear:
+            return dDate.year
+        if bDoMonth:
+            return dDate.month
+        return dDate.day
 
     #Return the ISO 8601 date string
-    sISO8601Date = ('0000' + str(iYear))[-4:] + '-' + ('00' + str(iMonth))[-2:] + '-' + ('00' + str(iDay))[-2:]
-    return sISO8601Date
+    return str(dDate)
+
+def pCJDNToGregorianFull(iCJDN):
+    ''' Returns the Gregorian date and the day of the week for a given
+           Chronological Julian Day Number (CJDN) in one call, as a GregDateFull
+           (year, month, day, dow).
+        The day of the week is as returned by DoW (Monday = 1; Sunday = 7).
+    '''
+
+    try:
+        iCJDN = operator.index(iCJDN)
+    except TypeError:
+        return False
+
+    # check CJDN is within the range supported by the calculation kernels
+    if abs(iCJDN) > MAXIMUM_CJDN:
+        return False
+
+    iYear, iMonth, iDay = _pCJDNToGregorian_ymd(iCJDN)
+
+    return GregDateFull(iYear, iMonth, iDay, (iCJDN % DAYS_IN_WEEK) + 1)
+
+def pCJDNToGregorian_vec(cjdns):
+    ''' Array version of pCJDNToGregorian. Returns the Gregorian dates for an
+           array-like of Chronological Julian Day Numbers (CJDN) as a tuple of
+           three NumPy int64 arrays: (years, months, days) (0-d for scalar input).
+        No range check is made; CJDNs beyond MAXIMUM_CJDN can silently
+           overflow int64.
+        Requires NumPy.
+    '''
+    _requireNumPy()
+    aCJDN = np.asarray(cjdns, dtype=np.int64)
+
+    #Perform the calculation in a single pass over the array
+    aK3 = (4 * (aCJDN - 1721120)) + 3
+    aX3, aR3 = np.divmod(aK3, 146097)
+    aK2 = (100 * (aR3 // 4)) + 99
+    aX2, aR2 = np.divmod(aK2, 36525)
+    aK1 = (5 * (aR2 // 100)) + 2
+    aX1, aR1 = np.divmod(aK1, 153)
+    aC0 = (aX1 + 2) // 12
+    aYear = (100 * aX3) + aX2 + aC0
+    aMonth = (aX1 - (12 * aC0)) + 3
+    aDay = (aR1 // 5) + 1
+
+    return np.asarray(aYear), np.asarray(aMonth), np.asarray(aDay)
+
+if _calendar_kernels is not None:
+    _mil_to_cjdn = _calendar_kernels.mil_to_cjdn
+else:
+    @njit('int64(int64, int64, int64)', cache=True)
+    def _mil_to_cjdn(iYear, iMonth, iDay):
+        ''' Calculation kernel for pMilankovicToCJDN.
+        '''
+        iC0 = (iMonth - 3) // 12
+        iX4 = iYear + iC0
+        iX3 = iX4 // 100
+        iX2 = iX4 % 100
+        iX1 = iMonth - (12 * iC0) - 3
+        iJ = (((328718 * iX3) + 6) // 9) + ((36525 * iX2) // 100) + (((153 * iX1) + 2) // 5) + iDay + 1721119
+
+        return iJ
 
 def pMilankovicToCJDN(sYear, sMonth, sDay):
     ''' Converts a Revised Julian or Milanković date passed in a three strings (year, month, day) to a
@@ -95,56 +379,196 @@ def pMilankovicToCJDN(sYear, sMonth, sDay):
         The zero point for the CJDN is 1 January -4712 (the whole day in local time).
         From: http://aa.quae.nl/en/reken/juliaansedag.html .
     '''
-    iYear = int(sYear)
-    iMonth = int(sMonth)
-    iDay = int(sDay)
+    # integers (including NumPy integers) pass straight through; strings are parsed
+    try:
+        iYear, iMonth, iDay = operator.index(sYear), operator.index(sMonth), operator.index(sDay)
+    except TypeError:
+        iYear, iMonth, iDay = int(sYear), int(sMonth), int(sDay)
 
     # check date is above minimum for the calendar
     if iYear < MINIMUM_YEAR_MILANKOVIC:
         return False
 
-    iC0 = floor((iMonth - 3) / 12)
-    iX4 = iYear + iC0
-    iX3 = floor(iX4 / 100)
-    iX2 = int(fmod(iX4, 100))
-    iX1 = iMonth - (12 * iC0) - 3
-    iJ = floor(((328718 * iX3) + 6) / 9) + floor((36525 * iX2) / 100) + floor(((153 * iX1) + 2) / 5) + iDay + 1721119
+    # check date is within the range supported by the calculation kernels
+    if max(abs(iYear), abs(iMonth), abs(iDay)) > MAXIMUM_DATE_PART:
+        return False
+
+    return _mil_to_cjdn(iYear, iMonth, iDay)
 
-    return iJ
+def pMilankovicToCJDN_vec(years, months, days):
+    ''' Array version of pMilankovicToCJDN. Converts Revised Julian dates passed as
+           array-likes of years, months, and days to a NumPy int64 array of
+           Chronological Julian Day Numbers (0-d for scalar input).
+        No minimum year or range check is made; callers should filter their dates
+           first. Years, months, or days beyond MAXIMUM_DATE_PART can silently
+           overflow int64.
+        Requires NumPy.
+    '''
+    _requireNumPy()
+    aYear = np.asarray(years, dtype=np.int64)
+    aMonth = np.asarray(months, dtype=np.int64)
+    aDay = np.asarray(days, dtype=np.int64)
+
+    aC0 = (aMonth - 3) // 12
+    aX4 = aYear + aC0
+    aX3 = aX4 // 100
+    aX2 = aX4 % 100
+    aX1 = aMonth - (12 * aC0) - 3
+    aJ = (((328718 * aX3) + 6) // 9) + ((36525 * aX2) // 100) + (((153 * aX1) + 2) // 5) + aDay + 1721119
+
+    return np.asarray(aJ)
+
+# The calculation kernel as a NumPy ufunc, for pMilankovicToCJDN_batch
+_fMilankovicToCJDNBatch = np.frompyfunc(_mil_to_cjdn, 3, 1) if np is not None else None
+
+def pMilankovicToCJDN_batch(years, months, days):
+    ''' Batch version of pMilankovicToCJDN for array-likes such as pandas Series,
+           e.g. df['cjdn'] = pMilankovicToCJDN_batch(df.year, df.month, df.day)
+        The inputs are converted to int64, as for pMilankovicToCJDN_vec, then the
+           scalar calculation kernel (compiled, if the compiled kernels are
+           built or Numba is enabled) is applied to each date. Returns a NumPy
+           int64 array (0-d for scalar input).
+        No minimum year or range check is made (see MAXIMUM_DATE_PART).
+        Requires NumPy.
+    '''
+    _requireNumPy()
+    aYear = np.asarray(years, dtype=np.int64)
+    aMonth = np.asarray(months, dtype=np.int64)
+    aDay = np.asarray(days, dtype=np.int64)
+
+    return np.asarray(_fMilankovicToCJDNBatch(aYear, aMonth, aDay), dtype=np.int64)
+
+if _calendar_kernels is not None:
+    _cjdn_to_mil = _calendar_kernels.cjdn_to_mil
+else:
+    @njit('UniTuple(int64, 3)(int64)', cache=True)
+    def _cjdn_to_mil(iCJDN):
+        ''' Calculation kernel for pCJDNToMilankovic. Returns (year, month, day).
+        '''
+        #Perform the calculation
+        iK3 = (9 * (iCJDN - 1721120)) + 2
+        iX3 = iK3 // 328718
+        iK2 = (100 * ((iK3 % 328718) // 9)) + 99
+        iX2 = iK2 // 36525
+        iK1 = (5 * ((iK2 % 36525) // 100)) + 2
+        iX1 = iK1 // 153
+        iC0 = (iX1 + 2) // 12
+        iYear = (100 * iX3) + iX2 + iC0
+        iMonth = (iX1 - (12 * iC0)) + 3
+        iDay = ((iK1 % 153) // 5) + 1
+
+        return iYear, iMonth, iDay
+
+@lru_cache(maxsize=4096)
+def _pCJDNToMilankovic_ymd(iCJDN):
+    ''' Returns the Revised Julian date for a given CJDN as a MilDate (year, month, day),
+           calculating all three parts in a single pass.
+    '''
+    return MilDate(*_cjdn_to_mil(iCJDN))
+
+def pCJDNToMilankovicDate(iCJDN):
+    ''' Returns a Revised Julian date as a MilDate (year, month, day) from a given
+        Chronological Julian Day Number (CJDN).
+        str() of the result gives the date in ISO 8601 YYYY-MM-DD format.
+    '''
+
+    try:
+        iCJDN = operator.index(iCJDN)
+    except TypeError:
+        return False
+
+    # check CJDN is within the range supported by the calculation kernels
+    if abs(iCJDN) > MAXIMUM_CJDN:
+        return False
+
+    return _pCJDNToMilankovic_ymd(iCJDN)
 
 def pCJDNToMilankovic(iCJDN, bDoYear=False, bDoMonth=False, bDoDay=False):
     ''' Returns a Revised Julian date is ISO 8601 YYYY-MM-DD format from a given
         Chronological Julian Day Number (CJDN).
-        If only part of the date is required (e.g. just the day), this is returned as an integer.
+        The bDoYear, bDoMonth, and bDoDay flags are deprecated; if one is set, only
+           that part of the date is returned, as an integer. Use the .year, .month,
+           and .day fields of pCJDNToMilankovicDate's MilDate instead.
     '''
 
-    if not isinstance(iCJDN, int):
+    dDate = pCJDNToMilankovicDate(iCJDN)
+    if dDate is False:
         return False
 
-    #Perform the calculation
-    iK3 = (9 * (iCJDN - 1721120)) + 2
-    iX3 = floor(iK3 / 328718)
-    iK2 = (100 * floor(int(fmod(iK3, 328718)) / 9)) + 99
-    iX2 = floor(iK2 / 36525)
-    iK1 = (5 * floor(int(fmod(iK2, 36525)) / 100)) + 2
-    iX1 = floor(iK1 / 153)
-    iC0 = floor((iX1 + 2) / 12)
-    iYear = (100 * iX3) + iX2 + iC0
-    iMonth = (iX1 - (12 * iC0)) + 3
-    iDay = floor(int(fmod(iK1, 153)) / 5) + 1
-
-    #Return integer part, if only one part of the date is required.
+    #Deprecated: return integer part, if only one part of the date is required.
     #Start at year, and rudely ignore any subsequent integers requested.
-    if bDoYear:
-        return iYear
-    if bDoMonth:
-        return iMonth
-    if bDoDay:
-        return iDay
+    if bDoYear or bDoMonth or bDoDay:
+        warnings.warn('pCJDNToMilankovic: bDoYear, bDoMonth, and bDoDay are deprecated; use the '
+                      '.year, .month, and .day fields of pCJDNToMilankovicDate instead',
+                      DeprecationWarning, stacklevel=2)
+        if bDoYear:
+            return dDate.year
+        if bDoMonth:
+            return dDate.month
+        return dDate.day
 
     #Return the ISO 8601 date string
-    sISO8601Date = ('0000' + str(iYear))[-4:] + '-' + ('00' + str(iMonth))[-2:] + '-' + ('00' + str(iDay))[-2:]
-    return sISO8601Date
+    return str(dDate)
+
+def pCJDNToMilankovicFull(iCJDN):
+    ''' Returns the Revised Julian date and the day of the week for a given
+           Chronological Julian Day Number (CJDN) in one call, as a MilDateFull
+           (year, month, day, dow).
+        The day of the week is as returned by DoW (Monday = 1; Sunday = 7).
+    '''
+
+    try:
+        iCJDN = operator.index(iCJDN)
+    except TypeError:
+        return False
+
+    # check CJDN is within the range supported by the calculation kernels
+    if abs(iCJDN) > MAXIMUM_CJDN:
+        return False
+
+    iYear, iMonth, iDay = _pCJDNToMilankovic_ymd(iCJDN)
+
+    return MilDateFull(iYear, iMonth, iDay, (iCJDN % DAYS_IN_WEEK) + 1)
+
+def pCJDNToMilankovic_vec(cjdns):
+    ''' Array version of pCJDNToMilankovic. Returns the Revised Julian dates for an
+           array-like of Chronological Julian Day Numbers (CJDN) as a tuple of
+           three NumPy int64 arrays: (years, months, days) (0-d for scalar input).
+        No range check is made; CJDNs beyond MAXIMUM_CJDN can silently
+           overflow int64.
+        Requires NumPy.
+    '''
+    _requireNumPy()
+    aCJDN = np.asarray(cjdns, dtype=np.int64)
+
+    #Perform the calculation in a single pass over the array
+    aK3 = (9 * (aCJDN - 1721120)) + 2
+    aX3, aR3 = np.divmod(aK3, 328718)
+    aK2 = (100 * (aR3 // 9)) + 99
+    aX2, aR2 = np.divmod(aK2, 36525)
+    aK1 = (5 * (aR2 // 100)) + 2
+    aX1, aR1 = np.divmod(aK1, 153)
+    aC0 = (aX1 + 2) // 12
+    aYear = (100 * aX3) + aX2 + aC0
+    aMonth = (aX1 - (12 * aC0)) + 3
+    aDay = (aR1 // 5) + 1
+
+    return np.asarray(aYear), np.asarray(aMonth), np.asarray(aDay)
+
+if _calendar_kernels is not None:
+    _jul_to_cjdn = _calendar_kernels.jul_to_cjdn
+else:
+    @njit('int64(int64, int64, int64)', cache=True)
+    def _jul_to_cjdn(iYear, iMonth, iDay):
+        ''' Calculation kernel for pJulianToCJDN.
+        '''
+        iJ0 = 1721117
+        iC0 = (iMonth - 3) // 12
+        iJ1 = ((iC0 + iYear) * 1461) // 4
+        iJ2 = ((153 * iMonth) - (1836 * iC0) - 457) // 5
+        iJ = iJ1 + iJ2 + iDay + iJ0
+
+        return iJ
 
 def pJulianToCJDN(sYear, sMonth, sDay):
     ''' Converts a Julian date passed in a three strings (year, month, day) to a
@@ -155,53 +579,177 @@ def pJulianToCJDN(sYear, sMonth, sDay):
         The zero point for the CJDN is 1 January -4712 (the whole day in local time).
         From: http://aa.quae.nl/en/reken/juliaansedag.html .
     '''
-    iYear = int(sYear)
-    iMonth = int(sMonth)
-    iDay = int(sDay)
+    # integers (including NumPy integers) pass straight through; strings are parsed
+    try:
+        iYear, iMonth, iDay = operator.index(sYear), operator.index(sMonth), operator.index(sDay)
+    except TypeError:
+        iYear, iMonth, iDay = int(sYear), int(sMonth), int(sDay)
 
     # check date is above minimum for the calendar
     if iYear < MINIMUM_YEAR_JULIAN:
         return False
 
+    # check date is within the range supported by the calculation kernels
+    if max(abs(iYear), abs(iMonth), abs(iDay)) > MAXIMUM_DATE_PART:
+        return False
+
+    return _jul_to_cjdn(iYear, iMonth, iDay)
+
+def pJulianToCJDN_vec(years, months, days):
+    ''' Array version of pJulianToCJDN. Converts Julian dates passed as
+           array-likes of years, months, and days to a NumPy int64 array of
+           Chronological Julian Day Numbers (0-d for scalar input).
+        No minimum year or range check is made; callers should filter their dates
+           first. Years, months, or days beyond MAXIMUM_DATE_PART can silently
+           overflow int64.
+        Requires NumPy.
+    '''
+    _requireNumPy()
+    aYear = np.asarray(years, dtype=np.int64)
+    aMonth = np.asarray(months, dtype=np.int64)
+    aDay = np.asarray(days, dtype=np.int64)
+
     iJ0 = 1721117
-    iC0 = floor((iMonth - 3) / 12)
-    iJ1 = floor(((iC0 + iYear) * 1461) / 4)
-    iJ2 = floor(((153 * iMonth) - (1836 * iC0) - 457) / 5)
-    iJ = iJ1 + iJ2 + iDay + iJ0
+    aC0 = (aMonth - 3) // 12
+    aJ1 = ((aC0 + aYear) * 1461) // 4
+    aJ2 = ((153 * aMonth) - (1836 * aC0) - 457) // 5
+    aJ = aJ1 + aJ2 + aDay + iJ0
+
+    return np.asarray(aJ)
+
+# The calculation kernel as a NumPy ufunc, for pJulianToCJDN_batch
+_fJulianToCJDNBatch = np.frompyfunc(_jul_to_cjdn, 3, 1) if np is not None else None
+
+def pJulianToCJDN_batch(years, months, days):
+    ''' Batch version of pJulianToCJDN for array-likes such as pandas Series,
+           e.g. df['cjdn'] = pJulianToCJDN_batch(df.year, df.month, df.day)
+        The inputs are converted to int64, as for pJulianToCJDN_vec, then the
+           scalar calculation kernel (compiled, if the compiled kernels are
+           built or Numba is enabled) is applied to each date. Returns a NumPy
+           int64 array (0-d for scalar input).
+        No minimum year or range check is made (see MAXIMUM_DATE_PART).
+        Requires NumPy.
+    '''
+    _requireNumPy()
+    aYear = np.asarray(years, dtype=np.int64)
+    aMonth = np.asarray(months, dtype=np.int64)
+    aDay = np.asarray(days, dtype=np.int64)
+
+    return np.asarray(_fJulianToCJDNBatch(aYear, aMonth, aDay), dtype=np.int64)
+
+if _calendar_kernels is not None:
+    _cjdn_to_jul = _calendar_kernels.cjdn_to_jul
+else:
+    @njit('UniTuple(int64, 3)(int64)', cache=True)
+    def _cjdn_to_jul(iCJDN):
+        ''' Calculation kernel for pCJDNToJulian. Returns (year, month, day).
+        '''
+        #Perform the calculation
+        iY2 = iCJDN - 1721118
+        iK2 = (4 * iY2) + 3
+        iK1 = (5 * ((iK2 % 1461) // 4)) + 2
+        iX1 = iK1 // 153
+        iC0 = (iX1 + 2) // 12
+        iYear = (iK2 // 1461) + iC0
+        iMonth = (iX1 - (12 * iC0)) + 3
+        iDay = ((iK1 % 153) // 5) + 1
+
+        return iYear, iMonth, iDay
+
+@lru_cache(maxsize=4096)
+def _pCJDNToJulian_ymd(iCJDN):
+    ''' Returns the Julian date for a given CJDN as a JulDate (year, month, day),
+           calculating all three parts in a single pass.
+    '''
+    return JulDate(*_cjdn_to_jul(iCJDN))
+
+def pCJDNToJulianDate(iCJDN):
+    ''' Returns a Julian date as a JulDate (year, month, day) from a given
+        Chronological Julian Day Number (CJDN).
+        str() of the result gives the date in ISO 8601 YYYY-MM-DD format.
+    '''
+
+    try:
+        iCJDN = operator.index(iCJDN)
+    except TypeError:
+        return False
+
+    # check CJDN is within the range supported by the calculation kernels
+    if abs(iCJDN) > MAXIMUM_CJDN:
+        return False
 
-    return iJ
+    return _pCJDNToJulian_ymd(iCJDN)
 
 def pCJDNToJulian(iCJDN, bDoYear=False, bDoMonth=False, bDoDay=False):
     ''' Returns a Julian date is ISO 8601 YYYY-MM-DD format from a given
         Chronological Julian Day Number (CJDN).
-        If only part of the date is required (e.g. just the day), this is returned as an integer.
+        The bDoYear, bDoMonth, and bDoDay flags are deprecated; if one is set, only
+           that part of the date is returned, as an integer. Use the .year, .month,
+           and .day fields of pCJDNToJulianDate's JulDate instead.
     '''
 
-    if not isinstance(iCJDN, int):
+    dDate = pCJDNToJulianDate(iCJDN)
+    if dDate is False:
         return False
 
-    #Perform the calculation
-    iY2 = iCJDN - 1721118
-    iK2 = (4 * iY2) + 3
-    iK1 = (5 * floor(int(fmod(iK2, 1461)) / 4)) + 2
-    iX1 = floor(iK1 / 153)
-    iC0 = floor((iX1 + 2) / 12)
-    iYear = floor(iK2 / 1461) + iC0
-    iMonth = (iX1 - (12 * iC0)) + 3
-    iDay = floor(int(fmod(iK1, 153)) / 5) + 1
-
-    #Return integer part, if only one part of the date is required.
+    #Deprecated: return integer part, if only one part of the date is required.
     #Start at year, and rudely ignore any subsequent integers requested.
-    if bDoYear:
-        return iYear
-    if bDoMonth:
-        return iMonth
-    if bDoDay:
-        return iDay
+    if bDoYear or bDoMonth or bDoDay:
+        warnings.warn('pCJDNToJulian: bDoYear, bDoMonth, and bDoDay are deprecated; use the '
+                      '.year, .month, and .day fields of pCJDNToJulianDate instead',
+                      DeprecationWarning, stacklevel=2)
+        if bDoYear:
+            return dDate.year
+        if bDoMonth:
+            return dDate.month
+        return dDate.day
 
     #Return the ISO 8601 date string
-    sISO8601Date = ('0000' + str(iYear))[-4:] + '-' + ('00' + str(iMonth))[-2:] + '-' + ('00' + str(iDay))[-2:]
-    return sISO8601Date
+    return str(dDate)
+
+def pCJDNToJulianFull(iCJDN):
+    ''' Returns the Julian date and the day of the week for a given
+           Chronological Julian Day Number (CJDN) in one call, as a JulDateFull
+           (year, month, day, dow).
+        The day of the week is as returned by DoW (Monday = 1; Sunday = 7).
+    '''
+
+    try:
+        iCJDN = operator.index(iCJDN)
+    except TypeError:
+        return False
+
+    # check CJDN is within the range supported by the calculation kernels
+    if abs(iCJDN) > MAXIMUM_CJDN:
+        return False
+
+    iYear, iMonth, iDay = _pCJDNToJulian_ymd(iCJDN)
+
+    return JulDateFull(iYear, iMonth, iDay, (iCJDN % DAYS_IN_WEEK) + 1)
+
+def pCJDNToJulian_vec(cjdns):
+    ''' Array version of pCJDNToJulian. Returns the Julian dates for an
+           array-like of Chronological Julian Day Numbers (CJDN) as a tuple of
+           three NumPy int64 arrays: (years, months, days) (0-d for scalar input).
+        No range check is made; CJDNs beyond MAXIMUM_CJDN can silently
+           overflow int64.
+        Requires NumPy.
+    '''
+    _requireNumPy()
+    aCJDN = np.asarray(cjdns, dtype=np.int64)
+
+    #Perform the calculation in a single pass over the array
+    aY2 = aCJDN - 1721118
+    aK2 = (4 * aY2) + 3
+    aX2, aR2 = np.divmod(aK2, 1461)
+    aK1 = (5 * (aR2 // 4)) + 2
+    aX1, aR1 = np.divmod(aK1, 153)
+    aC0 = (aX1 + 2) // 12
+    aYear = aX2 + aC0
+    aMonth = (aX1 - (12 * aC0)) + 3
+    aDay = (aR1 // 5) + 1
+
+    return np.asarray(aYear), np.asarray(aMonth), np.asarray(aDay)
 
 def DoW(iCJDN, iEDM=None):
     ''' Calculates the day of the week for a given date, for a given calendar.
@@ -210,20 +758,12 @@ def DoW(iCJDN, iEDM=None):
         that uses the earlier version.
         iEDM = 1 for Julian; 2 for Revised Julian, and 3 for Gregorian calendar.
     '''
-    # Constant defining the days in a week for each of the Gregorian, 
-    #   Revised Julian, and Julian calendars.
-    DAYS_IN_WEEK = 7
-
-    #Basic check of parameters
-    if not isinstance(iCJDN, int):
+    #Basic check of parameters (any integer type, including NumPy integers)
+    try:
+        iCJDN = operator.index(iCJDN)
+    except TypeError:
         return False
 
-    #Basic calculation
-    iD = (iCJDN + 1) % DAYS_IN_WEEK
-
-    #adjust day of week to correct ISO 8601 representation.
-    #   Monday = 1; Sunday = 7
-    if iD == 0:
-        iD = 7
-
-    return iD
+    #CJDN 0 is a Monday, so the remainder maps directly onto the
+    #   ISO 8601 representation: Monday = 1; Sunday = 7
+    return (iCJDN % DAYS_IN_WEEK) + 1
@@ -0,0 +1,81 @@
+# cython: language_level=3
+'''
+Ahead-of-time compiled calculation kernels for MattaCalendarCalculations.
+
+Build in place with:
+    python setup.py build_ext --inplace
+
+MattaCalendarCalculations uses these kernels when the compiled module is
+   present, and otherwise falls back to its own (Numba or plain Python) kernels.
+   The arithmetic here must be kept identical to those kernels.
+Integer division keeps Python semantics (cdivision is off), so // and %
+   floor for negative values, as in the Python code.
+'''
+
+
+cpdef long long greg_to_cjdn(long long iYear, long long iMonth, long long iDay):
+    ''' Calculation kernel for pGregorianToCJDN.
+    '''
+    cdef long long iC0, iX4, iX3, iX2, iX1
+    iC0 = (iMonth - 3) // 12
+    iX4 = iYear + iC0
+    iX3 = iX4 // 100
+    iX2 = iX4 % 100
+    iX1 = iMonth - (12 * iC0) - 3
+    return ((146097 * iX3) // 4) + ((36525 * iX2) // 100) + (((153 * iX1) + 2) // 5) + iDay + 1721119
+
+cpdef tuple cjdn_to_greg(long long iCJDN):
+    ''' Calculation kernel for pCJDNToGregorian. Returns (year, month, day).
+    '''
+    cdef long long iK3, iX3, iK2, iX2, iK1, iX1, iC0
+    iK3 = (4 * (iCJDN - 1721120)) + 3
+    iX3 = iK3 // 146097
+    iK2 = (100 * ((iK3 % 146097) // 4)) + 99
+    iX2 = iK2 // 36525
+    iK1 = (5 * ((iK2 % 36525) // 100)) + 2
+    iX1 = iK1 // 153
+    iC0 = (iX1 + 2) // 12
+    return (100 * iX3) + iX2 + iC0, (iX1 - (12 * iC0)) + 3, ((iK1 % 153) // 5) + 1
+
+cpdef long long mil_to_cjdn(long long iYear, long long iMonth, long long iDay):
+    ''' Calculation kernel for pMilankovicToCJDN.
+    '''
+    cdef long long iC0, iX4, iX3, iX2, iX1
+    iC0 = (iMonth - 3) // 12
+    iX4 = iYear + iC0
+    iX3 = iX4 // 100
+    iX2 = iX4 % 100
+    iX1 = iMonth - (12 * iC0) - 3
+    return (((328718 * iX3) + 6) // 9) + ((36525 * iX2) // 100) + (((153 * iX1) + 2) // 5) + iDay + 1721119
+
+cpdef tuple cjdn_to_mil(long long iCJDN):
+    ''' Calculation kernel for pCJDNToMilankovic. Returns (year, month, day).
+    '''
+    cdef long long iK3, iX3, iK2, iX2, iK1, iX1, iC0
+    iK3 = (9 * (iCJDN - 1721120)) + 2
+    iX3 = iK3 // 328718
+    iK2 = (100 * ((iK3 % 328718) // 9)) + 99
+    iX2 = iK2 // 36525
+    iK1 = (5 * ((iK2 % 36525) // 100)) + 2
+    iX1 = iK1 // 153
+    iC0 = (iX1 + 2) // 12
+    return (100 * iX3) + iX2 + iC0, (iX1 - (12 * iC0)) + 3, ((iK1 % 153) // 5) + 1
+
+cpdef long long jul_to_cjdn(long long iYear, long long iMonth, long long iDay):
+    ''' Calculation kernel for pJulianToCJDN.
+    '''
+    cdef long long iC0, iJ1, iJ2
+    iC0 = (iMonth - 3) // 12
+    iJ1 = ((iC0 + iYear) * 1461) // 4
+    iJ2 = ((153 * iMonth) - (1836 * iC0) - 457) // 5
+    return iJ1 + iJ2 + iDay + 1721117
+
+cpdef tuple cjdn_to_jul(long long iCJDN):
+    ''' Calculation kernel for pCJDNToJulian. Returns (year, month, day).
+    '''
+    cdef long long iK2, iK1, iX1, iC0
+    iK2 = (4 * (iCJDN - 1721118)) + 3
+    iK1 = (5 * ((iK2 % 1461) // 4)) + 2
+    iX1 = iK1 // 153
+    iC0 = (iX1 + 2) // 12
+    return (iK2 // 1461) + iC0, (iX1 - (12 * iC0)) + 3, ((iK1 % 153) // 5) + 1
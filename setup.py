@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+'''
+Builds the optional ahead-of-time compiled calculation kernels.
+
+    python setup.py build_ext --inplace
+
+Requires Cython and a C compiler. Without them, only the pure Python module
+   is installed; MattaCalendarCalculations then uses Numba (if installed) or
+   plain Python.
+'''
+
+from setuptools import setup
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    ext_modules = []
+else:
+    ext_modules = cythonize('_calendar_kernels.pyx', language_level=3)
+    # without a C compiler, install the pure Python module rather than fail
+    for ext in ext_modules:
+        ext.optional = True
+
+setup(
+    name='MattaCalendarCalculations',
+    py_modules=['MattaCalendarCalculations'],
+    ext_modules=ext_modules,
+)
@@ -0,0 +1,381 @@
+#!/usr/bin/env python3
+'''
+Tests for MattaCalendarCalculations.
+
+Run with:
+    python -m unittest test_MattaCalendarCalculations
+'''
+
+
+import unittest
+import warnings
+from math import floor
+from math import fmod
+
+import MattaCalendarCalculations as MCC
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# CJDN of 1 March AD 0; from here on the original floor/fmod calculations
+#    and the current integer calculations must agree.
+CJDN_AD0 = 1721120
+# CJDN of 31 December 9999 (Gregorian), the end of the swept range.
+CJDN_END = 5373484
+
+
+# The original (2022) calculations, kept to check the current ones against.
+def _origGregorianToCJDN(iYear, iMonth, iDay):
+    iC0 = floor((iMonth - 3) / 12)
+    iX4 = iYear + iC0
+    iX3 = floor(iX4 / 100)
+    iX2 = int(fmod(iX4, 100))
+    iX1 = iMonth - (12 * iC0) - 3
+    return floor((146097 * iX3) / 4) + floor((36525 * iX2) / 100) + floor(((153 * iX1) + 2) / 5) + iDay + 1721119
+
+def _origCJDNToGregorian(iCJDN):
+    iK3 = (4 * (iCJDN - 1721120)) + 3
+    iX3 = floor(iK3 / 146097)
+    iK2 = (100 * floor(int(fmod(iK3, 146097)) / 4)) + 99
+    iX2 = floor(iK2 / 36525)
+    iK1 = (5 * floor(int(fmod(iK2, 36525)) / 100)) + 2
+    iX1 = floor(iK1 / 153)
+    iC0 = floor((iX1 + 2) / 12)
+    return (100 * iX3) + iX2 + iC0, (iX1 - (12 * iC0)) + 3, floor(int(fmod(iK1, 153)) / 5) + 1
+
+def _origMilankovicToCJDN(iYear, iMonth, iDay):
+    iC0 = floor((iMonth - 3) / 12)
+    iX4 = iYear + iC0
+    iX3 = floor(iX4 / 100)
+    iX2 = int(fmod(iX4, 100))
+    iX1 = iMonth - (12 * iC0) - 3
+    return floor(((328718 * iX3) + 6) / 9) + floor((36525 * iX2) / 100) + floor(((153 * iX1) + 2) / 5) + iDay + 1721119
+
+def _origCJDNToMilankovic(iCJDN):
+    iK3 = (9 * (iCJDN - 1721120)) + 2
+    iX3 = floor(iK3 / 328718)
+    iK2 = (100 * floor(int(fmod(iK3, 328718)) / 9)) + 99
+    iX2 = floor(iK2 / 36525)
+    iK1 = (5 * floor(int(fmod(iK2, 36525)) / 100)) + 2
+    iX1 = floor(iK1 / 153)
+    iC0 = floor((iX1 + 2) / 12)
+    return (100 * iX3) + iX2 + iC0, (iX1 - (12 * iC0)) + 3, floor(int(fmod(iK1, 153)) / 5) + 1
+
+def _origJulianToCJDN(iYear, iMonth, iDay):
+    iC0 = floor((iMonth - 3) / 12)
+    iJ1 = floor(((iC0 + iYear) * 1461) / 4)
+    iJ2 = floor(((153 * iMonth) - (1836 * iC0) - 457) / 5)
+    return iJ1 + iJ2 + iDay + 1721117
+
+def _origCJDNToJulian(iCJDN):
+    iK2 = (4 * (iCJDN - 1721118)) + 3
+    iK1 = (5 * floor(int(fmod(iK2, 1461)) / 4)) + 2
+    iX1 = floor(iK1 / 153)
+    iC0 = floor((iX1 + 2) / 12)
+    return floor(iK2 / 1461) + iC0, (iX1 - (12 * iC0)) + 3, floor(int(fmod(iK1, 153)) / 5) + 1
+
+
+# (name, minimum year, original to CJDN, original from CJDN,
+#    public to CJDN, public from CJDN, calculation kernel to CJDN)
+CALENDARS = [
+    ('Gregorian', MCC.MINIMUM_YEAR_GREGORIAN, _origGregorianToCJDN, _origCJDNToGregorian,
+     MCC.pGregorianToCJDN, MCC.pCJDNToGregorianDate, MCC._greg_to_cjdn),
+    ('Milankovic', MCC.MINIMUM_YEAR_MILANKOVIC, _origMilankovicToCJDN, _origCJDNToMilankovic,
+     MCC.pMilankovicToCJDN, MCC.pCJDNToMilankovicDate, MCC._mil_to_cjdn),
+    ('Julian', MCC.MINIMUM_YEAR_JULIAN, _origJulianToCJDN, _origCJDNToJulian,
+     MCC.pJulianToCJDN, MCC.pCJDNToJulianDate, MCC._jul_to_cjdn),
+]
+
+
+class TestIntegerCalculations(unittest.TestCase):
+    ''' The integer (// and %) calculations against the original floor/fmod ones.
+    '''
+
+    def test_to_cjdn_matches_original(self):
+        for sName, iMinYear, fOrigTo, _, fTo, _, _ in CALENDARS:
+            with self.subTest(calendar=sName):
+                lDiffs = [(iYear, iMonth, iDay)
+                          for iYear in range(iMinYear, 10000, 7)
+                          for iMonth in range(1, 13)
+                          for iDay in (1, 15, 28)
+                          if fTo(iYear, iMonth, iDay) != fOrigTo(iYear, iMonth, iDay)]
+                self.assertEqual(lDiffs, [])
+
+    def test_from_cjdn_matches_original_from_AD0(self):
+        for sName, _, _, fOrigFrom, _, fFrom, _ in CALENDARS:
+            with self.subTest(calendar=sName):
+                lDiffs = [iCJDN for iCJDN in range(CJDN_AD0, CJDN_END + 1, 13)
+                          if tuple(fFrom(iCJDN)) != fOrigFrom(iCJDN)]
+                self.assertEqual(lDiffs, [])
+
+    def test_round_trip(self):
+        # The public date to CJDN functions refuse years before each calendar's
+        #    minimum, so the calculation kernels are used for the way back.
+        for sName, _, _, _, _, fFrom, fKernelTo in CALENDARS:
+            with self.subTest(calendar=sName):
+                lDiffs = [iCJDN for iCJDN in range(0, CJDN_END + 1, 11)
+                          if fKernelTo(*fFrom(iCJDN)) != iCJDN]
+                self.assertEqual(lDiffs, [])
+
+    def test_round_trip_january_and_february(self):
+        # January and February give a negative iC0 in the date to CJDN calculations
+        for sName, _, _, _, _, fFrom, fKernelTo in CALENDARS:
+            with self.subTest(calendar=sName):
+                lDiffs = [(iYear, iMonth, iDay)
+                          for iYear in list(range(-4712, 10000, 97)) + [-4, 0, 4, 100, 1900, 2000]
+                          for iMonth, iLastDay in ((1, 31), (2, 28))
+                          for iDay in range(1, iLastDay + 1)
+                          if tuple(fFrom(fKernelTo(iYear, iMonth, iDay))) != (iYear, iMonth, iDay)]
+                self.assertEqual(lDiffs, [])
+
+    def test_leap_day(self):
+        self.assertEqual(str(MCC.pCJDNToGregorianDate(MCC.pGregorianToCJDN(2000, 2, 29))), '2000-02-29')
+        self.assertEqual(str(MCC.pCJDNToGregorianDate(MCC.pGregorianToCJDN(1900, 2, 29))), '1900-03-01')
+        self.assertEqual(str(MCC.pCJDNToJulianDate(MCC.pJulianToCJDN(1900, 2, 29))), '1900-02-29')
+        self.assertEqual(str(MCC.pCJDNToMilankovicDate(MCC.pMilankovicToCJDN(2800, 2, 29))), '2800-03-01')
+
+    def test_differences_before_AD0(self):
+        # The original fmod calculations gave invalid dates before 1 March AD 0
+        self.assertEqual(MCC.pCJDNToGregorianDate(0), (-4713, 11, 24))
+        self.assertEqual(str(MCC.pCJDNToGregorianDate(0)), '-4713-11-24')
+        self.assertEqual(_origCJDNToGregorian(0), (-4814, 11, -4))
+        self.assertEqual(str(MCC.pCJDNToJulianDate(0)), '-4712-01-01')
+        self.assertEqual(_origCJDNToJulian(0), (-4713, 1, -28))
+        self.assertEqual(str(MCC.pCJDNToGregorianDate(CJDN_AD0 - 1)), '0000-02-29')
+        self.assertEqual(_origCJDNToGregorian(CJDN_AD0 - 1), (-101, 2, 0))
+
+
+
+@unittest.skipIf(np is None, 'NumPy is not installed')
+class TestToCJDNArrays(unittest.TestCase):
+    ''' The array (_vec) date to CJDN functions against the scalar ones.
+    '''
+
+    def setUp(self):
+        # every month of a spread of years, including years before AD 0
+        aYear = np.arange(-4712, 10000, 13)
+        self.aYears = np.repeat(aYear, 12 * 3)
+        self.aMonths = np.tile(np.repeat(np.arange(1, 13), 3), len(aYear))
+        self.aDays = np.tile(np.array([1, 15, 28]), 12 * len(aYear))
+
+    def test_vec_matches_scalar(self):
+        for sName, iMinYear, _, _, fTo, _, fKernelTo in CALENDARS:
+            with self.subTest(calendar=sName):
+                fVec = getattr(MCC, 'p%sToCJDN_vec' % sName)
+                aCJDN = fVec(self.aYears, self.aMonths, self.aDays)
+                self.assertEqual(aCJDN.dtype, np.int64)
+                # the scalar functions refuse years before the calendar's minimum
+                lExpected = [fTo(iYear, iMonth, iDay) if iYear >= iMinYear else fKernelTo(iYear, iMonth, iDay)
+                             for iYear, iMonth, iDay in zip(self.aYears.tolist(), self.aMonths.tolist(), self.aDays.tolist())]
+                self.assertEqual(aCJDN.tolist(), lExpected)
+
+    def test_vec_scalar_input(self):
+        for sName, _, _, _, fTo, _, _ in CALENDARS:
+            with self.subTest(calendar=sName):
+                aCJDN = getattr(MCC, 'p%sToCJDN_vec' % sName)(2022, 8, 28)
+                self.assertIsInstance(aCJDN, np.ndarray)
+                self.assertEqual((aCJDN.shape, aCJDN.dtype), ((), np.int64))
+                self.assertEqual(int(aCJDN), fTo(2022, 8, 28))
+
+    def test_vec_accepts_lists_and_keeps_shape(self):
+        aCJDN = MCC.pGregorianToCJDN_vec([[2022, 2000]], [[8, 2]], [[28, 29]])
+        self.assertEqual(aCJDN.shape, (1, 2))
+        self.assertEqual(aCJDN.tolist(), [[MCC.pGregorianToCJDN(2022, 8, 28), MCC.pGregorianToCJDN(2000, 2, 29)]])
+
+
+
+@unittest.skipIf(np is None, 'NumPy is not installed')
+class TestFromCJDNArrays(unittest.TestCase):
+    ''' The array (_vec) CJDN to date functions against the scalar ones.
+    '''
+
+    def test_vec_matches_scalar(self):
+        # including negative CJDNs, before 1 January -4712 (Julian)
+        aCJDN = np.arange(-1000000, CJDN_END + 1, 37)
+        for sName, _, _, _, _, fFrom, _ in CALENDARS:
+            with self.subTest(calendar=sName):
+                fVec = getattr(MCC, 'pCJDNTo%s_vec' % sName)
+                aYear, aMonth, aDay = fVec(aCJDN)
+                self.assertEqual((aYear.dtype, aMonth.dtype, aDay.dtype), (np.int64, np.int64, np.int64))
+                lExpected = [tuple(fFrom(iCJDN)) for iCJDN in aCJDN.tolist()]
+                self.assertEqual(list(zip(aYear.tolist(), aMonth.tolist(), aDay.tolist())), lExpected)
+
+    def test_vec_scalar_input(self):
+        for sName, _, _, _, _, fFrom, _ in CALENDARS:
+            with self.subTest(calendar=sName):
+                tDate = getattr(MCC, 'pCJDNTo%s_vec' % sName)(2459820)
+                for aPart in tDate:
+                    self.assertIsInstance(aPart, np.ndarray)
+                    self.assertEqual((aPart.shape, aPart.dtype), ((), np.int64))
+                self.assertEqual(tuple(int(aPart) for aPart in tDate), tuple(fFrom(2459820)))
+
+    def test_vec_round_trip(self):
+        aCJDN = np.arange(-1000000, CJDN_END + 1)
+        for sName, _, _, _, _, _, _ in CALENDARS:
+            with self.subTest(calendar=sName):
+                aYear, aMonth, aDay = getattr(MCC, 'pCJDNTo%s_vec' % sName)(aCJDN)
+                aBack = getattr(MCC, 'p%sToCJDN_vec' % sName)(aYear, aMonth, aDay)
+                self.assertTrue(np.array_equal(aBack, aCJDN))
+
+
+
+@unittest.skipIf(np is None, 'NumPy is not installed')
+class TestToCJDNBatch(unittest.TestCase):
+    ''' The batch (_batch) date to CJDN functions against the _vec and scalar ones.
+    '''
+
+    def test_batch_matches_vec(self):
+        # including years before AD 0, which give negative CJDNs
+        aYears = np.arange(-4712, 10000, 3)
+        aMonths = (aYears % 12) + 1
+        aDays = (aYears % 28) + 1
+        for sName, _, _, _, _, _, _ in CALENDARS:
+            with self.subTest(calendar=sName):
+                aBatch = getattr(MCC, 'p%sToCJDN_batch' % sName)(aYears, aMonths, aDays)
+                aVec = getattr(MCC, 'p%sToCJDN_vec' % sName)(aYears, aMonths, aDays)
+                self.assertEqual(aBatch.dtype, np.int64)
+                self.assertTrue(np.array_equal(aBatch, aVec))
+
+    def test_batch_scalar_input(self):
+        for sName, _, _, _, fTo, _, _ in CALENDARS:
+            with self.subTest(calendar=sName):
+                fBatch = getattr(MCC, 'p%sToCJDN_batch' % sName)
+                for aCJDN in (fBatch(2022, 8, 28), fBatch(np.int64(2022), np.array(8), np.array(28))):
+                    self.assertIsInstance(aCJDN, np.ndarray)
+                    self.assertEqual((aCJDN.shape, aCJDN.dtype), ((), np.int64))
+                    self.assertEqual(int(aCJDN), fTo(2022, 8, 28))
+
+    def test_batch_converts_input_like_vec(self):
+        # floats and strings are converted to int64 first, whichever kernel is in use
+        for sName, _, _, _, _, _, _ in CALENDARS:
+            with self.subTest(calendar=sName):
+                fBatch = getattr(MCC, 'p%sToCJDN_batch' % sName)
+                fVec = getattr(MCC, 'p%sToCJDN_vec' % sName)
+                for tInput in (([2022.5], [8.0], [28.9]), (['2022'], ['08'], ['28'])):
+                    self.assertEqual(fBatch(*tInput).tolist(), fVec(*tInput).tolist())
+                    self.assertEqual(fBatch(*tInput).tolist(), fVec([2022], [8], [28]).tolist())
+
+    def test_batch_accepts_lists(self):
+        for sName, _, _, _, fTo, _, _ in CALENDARS:
+            with self.subTest(calendar=sName):
+                aBatch = getattr(MCC, 'p%sToCJDN_batch' % sName)([2022, 2000], [8, 2], [28, 29])
+                self.assertEqual(aBatch.tolist(), [fTo(2022, 8, 28), fTo(2000, 2, 29)])
+
+
+
+class TestArguments(unittest.TestCase):
+    ''' Coercion and checking of the arguments to the scalar functions.
+    '''
+
+    def test_date_parts_as_strings(self):
+        self.assertEqual(MCC.pGregorianToCJDN('2022', '08', '28'), MCC.pGregorianToCJDN(2022, 8, 28))
+
+    def test_non_integer_cjdn_is_rejected(self):
+        for xCJDN in (2459820.0, '2459820', None):
+            with self.subTest(cjdn=xCJDN):
+                self.assertIs(MCC.pCJDNToGregorianDate(xCJDN), False)
+                self.assertIs(MCC.pCJDNToJulianFull(xCJDN), False)
+                self.assertIs(MCC.DoW(xCJDN), False)
+
+    @unittest.skipIf(np is None, 'NumPy is not installed')
+    def test_numpy_integer_cjdn(self):
+        for xCJDN in (np.int64(2459820), np.int32(2459820), np.arange(2459820, 2459821)[0]):
+            with self.subTest(cjdn=repr(xCJDN)):
+                self.assertEqual(MCC.pCJDNToGregorianDate(xCJDN), (2022, 8, 28))
+                self.assertEqual(str(MCC.pCJDNToMilankovicDate(xCJDN)), '2022-08-28')
+                self.assertEqual(str(MCC.pCJDNToJulianDate(xCJDN)), '2022-08-15')
+                self.assertEqual(MCC.pCJDNToGregorianFull(xCJDN), (2022, 8, 28, 7))
+                self.assertEqual(MCC.DoW(xCJDN), 7)
+                self.assertEqual(MCC.pCJDNToGregorian(xCJDN), '2022-08-28')
+
+    @unittest.skipIf(np is None, 'NumPy is not installed')
+    def test_numpy_integer_date_parts(self):
+        self.assertEqual(MCC.pGregorianToCJDN(np.int64(2022), np.int32(8), np.int16(28)), 2459820)
+        self.assertIs(type(MCC.pGregorianToCJDN(np.int64(2022), np.int64(8), np.int64(28))), int)
+
+
+
+class TestStringAPI(unittest.TestCase):
+    ''' The pCJDNTo* functions keep their original string results, and their
+           deprecated flags keep their integer results.
+    '''
+
+    def test_iso_string(self):
+        for sName, sExpected in (('Gregorian', '2022-08-28'), ('Milankovic', '2022-08-28'), ('Julian', '2022-08-15')):
+            with self.subTest(calendar=sName):
+                with warnings.catch_warnings():
+                    warnings.simplefilter('error')
+                    sDate = getattr(MCC, 'pCJDNTo%s' % sName)(2459820)
+                self.assertEqual(sDate, sExpected)
+                self.assertEqual(sDate, str(getattr(MCC, 'pCJDNTo%sDate' % sName)(2459820)))
+
+    def test_flags(self):
+        with self.assertWarns(DeprecationWarning):
+            self.assertEqual(MCC.pCJDNToJulian(2459820, True), 2022)
+        with self.assertWarns(DeprecationWarning):
+            self.assertEqual(MCC.pCJDNToJulian(2459820, False, True), 8)
+        with self.assertWarns(DeprecationWarning):
+            self.assertEqual(MCC.pCJDNToJulian(2459820, False, False, True), 15)
+
+    def test_invalid_cjdn(self):
+        self.assertIs(MCC.pCJDNToGregorian(2459820.0), False)
+
+    def test_named_tuple(self):
+        dDate = MCC.pCJDNToGregorianDate(2459820)
+        self.assertIsInstance(dDate, MCC.GregDate)
+        self.assertEqual((dDate.year, dDate.month, dDate.day), (2022, 8, 28))
+        self.assertEqual(str(dDate), '2022-08-28')
+
+
+
+class TestDayOfWeek(unittest.TestCase):
+    ''' DoW and the *Full functions, which return the date with its day of the week.
+    '''
+
+    def test_dow(self):
+        self.assertEqual(MCC.DoW(0), 1)   # CJDN 0 is a Monday
+        self.assertEqual(MCC.DoW(2459820), 7)   # 2022-08-28 is a Sunday
+        self.assertEqual([MCC.DoW(iCJDN) for iCJDN in range(-7, 7)], [1, 2, 3, 4, 5, 6, 7] * 2)
+
+    def test_full(self):
+        for sName, sClass, tExpected in (('Gregorian', 'GregDateFull', (2022, 8, 28, 7)),
+                                         ('Milankovic', 'MilDateFull', (2022, 8, 28, 7)),
+                                         ('Julian', 'JulDateFull', (2022, 8, 15, 7))):
+            with self.subTest(calendar=sName):
+                dDate = getattr(MCC, 'pCJDNTo%sFull' % sName)(2459820)
+                self.assertIsInstance(dDate, getattr(MCC, sClass))
+                self.assertEqual(dDate, tExpected)
+                self.assertEqual(dDate.dow, MCC.DoW(2459820))
+                self.assertEqual(str(dDate), str(getattr(MCC, 'pCJDNTo%sDate' % sName)(2459820)))
+
+
+
+class TestRange(unittest.TestCase):
+    ''' Values outside the range the 64-bit calculation kernels support are refused.
+    '''
+
+    def test_date_parts(self):
+        iLimit = MCC.MAXIMUM_DATE_PART
+        for sName, _, _, _, fTo, _, _ in CALENDARS:
+            with self.subTest(calendar=sName):
+                self.assertIsNot(fTo(iLimit, 1, 1), False)
+                self.assertIs(fTo(iLimit + 1, 1, 1), False)
+                self.assertIs(fTo(2000, iLimit + 1, 1), False)
+                self.assertIs(fTo(2000, 1, -iLimit - 1), False)
+
+    def test_cjdn(self):
+        iLimit = MCC.MAXIMUM_CJDN
+        for sName, _, _, _, _, fFrom, _ in CALENDARS:
+            with self.subTest(calendar=sName):
+                self.assertIsNot(fFrom(iLimit), False)
+                self.assertIsNot(fFrom(-iLimit), False)
+                self.assertIs(fFrom(iLimit + 1), False)
+                self.assertIs(fFrom(-iLimit - 1), False)
+                self.assertIs(fFrom(10**30), False)
+                self.assertIs(getattr(MCC, 'pCJDNTo%sFull' % sName)(10**30), False)
+
+
+if __name__ == '__main__':
+    unittest.main()